@@ -1,5 +1,8 @@
 from fastapi import APIRouter
 
-from app.router.v1.endpoints import auth
+from app.router.v1.endpoints import auth, heroes, users
 
 api_router = APIRouter()
+api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
+api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(heroes.router, prefix="/heroes", tags=["heroes"])
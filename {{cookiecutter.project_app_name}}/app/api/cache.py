@@ -0,0 +1,55 @@
+import uuid as uuid_pkg
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.api.models import UserModel
+from app.core.cache import CacheBackend, InMemoryCacheBackend, NullCacheBackend
+from app.core.config import settings
+
+
+class UserCache:
+    """Current user lookups cache, keyed by user uuid.
+
+    Entries must be invalidated by whoever updates or deletes users,
+    see `UserService`.
+    """
+
+    __backend: CacheBackend
+
+    def __init__(self, backend: CacheBackend):
+        self.__backend = backend
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self.__backend
+
+    async def get(
+        self, user_uuid: str | uuid_pkg.UUID, db_async_session: AsyncSession
+    ) -> UserModel | None:
+        """Returns cached user attached to the session, without querying the database"""
+        data = await self.__backend.get(str(user_uuid))
+        if data is None:
+            return None
+
+        user = UserModel(**data)
+        make_transient_to_detached(user)
+        return await db_async_session.merge(user, load=False)
+
+    async def set(self, user: UserModel) -> None:
+        await self.__backend.set(str(user.uuid), user.dict())
+
+    async def invalidate(self, user_uuid: str | uuid_pkg.UUID) -> None:
+        await self.__backend.delete(str(user_uuid))
+
+
+def _get_user_cache_backend() -> CacheBackend:
+    if settings.USER_CACHE_BACKEND == "memory":
+        return InMemoryCacheBackend(
+            max_size=settings.USER_CACHE_MAX_SIZE,
+            ttl=settings.USER_CACHE_TTL_SECONDS,
+        )
+    return NullCacheBackend()
+
+
+user_cache = UserCache(backend=_get_user_cache_backend())
@@ -0,0 +1,32 @@
+from collections.abc import Sequence
+from typing import Any
+
+from app.api.cache import user_cache
+from app.api.models import HeroModel, UserModel
+from app.core.queries import BaseQueryset
+
+
+class HeroQueryset(BaseQueryset[HeroModel]):
+    def _get_db_model_class(self) -> type[HeroModel]:
+        return HeroModel
+
+
+class UserQueryset(BaseQueryset[UserModel]):
+    """Bulk update/delete bypass `UserService`, so they invalidate cached users here"""
+
+    def _get_db_model_class(self) -> type[UserModel]:
+        return UserModel
+
+    async def bulk_update(
+        self, ids: Sequence[Any], values: dict[str, Any]
+    ) -> list[UserModel]:
+        users = await super().bulk_update(ids, values)
+        for user in users:
+            await user_cache.invalidate(user.uuid)
+        return users
+
+    async def bulk_delete(self, ids: Sequence[Any]) -> list[Any]:
+        deleted = await super().bulk_delete(ids)
+        for user_uuid in deleted:
+            await user_cache.invalidate(user_uuid)
+        return deleted
@@ -1,7 +1,7 @@
 from typing import Optional
 import uuid as uuid_pkg
 
-from sqlalchemy import Column, event
+from sqlalchemy import Column, Index, event
 from sqlalchemy.databases import postgres
 from sqlmodel import SQLModel, Field
 
@@ -32,6 +32,8 @@ class UserBase(SQLModel):
 
 class UserModel(TimestampModel, UUIDModel, UserBase, table=True):
     __tablename__ = f"{prefix}_users"
+    # Keyset pagination order, see `app.core.pagination`
+    __table_args__ = (Index(f"ix_{prefix}_users_created_at_uuid", "created_at", "uuid"),)
 
     hashed_password: str
 
@@ -49,5 +51,7 @@ class HeroBase(SQLModel):
 
 class HeroModel(TimestampModel, UUIDModel, HeroBase, table=True):
     __tablename__ = f"{prefix}_heroes"
+    # Keyset pagination order, see `app.core.pagination`
+    __table_args__ = (Index(f"ix_{prefix}_heroes_created_at_uuid", "created_at", "uuid"),)
 
     user_uuid: Optional[uuid_pkg.UUID] = Field(default=None, foreign_key=f"{prefix}_users.uuid")
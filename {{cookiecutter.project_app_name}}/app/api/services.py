@@ -0,0 +1,51 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.cache import user_cache
+from app.api.models import UserModel
+from app.core.db import get_async_session
+from app.core.security.services import JWTService
+from app.schemas.requests import UserCreateRequest, UserUpdatePasswordRequest
+
+
+class UserService:
+    __db_async_session: AsyncSession
+
+    def __init__(
+        self,
+        db_async_session: AsyncSession = Depends(get_async_session),
+    ):
+        self.__db_async_session = db_async_session
+
+    async def create_user(self, user_in: UserCreateRequest) -> UserModel:
+        """Creates a new user, password is hashed in the password hasher pool.
+
+        Raises `PasswordHasherBusyError` if the pool queue is full.
+        """
+        user = UserModel(
+            email=user_in.email,
+            nickname=user_in.nickname,
+            hashed_password=await JWTService.get_password_hash_async(user_in.password),
+        )
+        self.__db_async_session.add(user)
+        await self.__db_async_session.commit()
+        await self.__db_async_session.refresh(user)
+        return user
+
+    async def update_password(
+        self, user: UserModel, user_in: UserUpdatePasswordRequest
+    ) -> UserModel:
+        """Sets a new password, hashed in the password hasher pool.
+
+        Raises `PasswordHasherBusyError` if the pool queue is full.
+        """
+        user.hashed_password = await JWTService.get_password_hash_async(user_in.password)
+        self.__db_async_session.add(user)
+        await self.__db_async_session.commit()
+        await user_cache.invalidate(user.uuid)
+        return user
+
+    async def delete_user(self, user: UserModel) -> None:
+        await self.__db_async_session.delete(user)
+        await self.__db_async_session.commit()
+        await user_cache.invalidate(user.uuid)
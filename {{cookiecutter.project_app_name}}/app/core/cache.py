@@ -0,0 +1,132 @@
+"""
+Cache tools.
+
+`LRUTTLCache` is a size bounded, in-process LRU with per entry expiration.
+`CacheBackend` is the async interface used by application caches, so a shared
+cache (Redis, Memcached...) can be plugged in by implementing it, values are
+plain dicts to keep them serializable.
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, TypeVar
+
+CacheValue = TypeVar("CacheValue")
+
+
+class LRUTTLCache(Generic[CacheValue]):
+    """Thread safe, sync callers (run in the threadpool) may share it."""
+
+    __max_size: int
+    __ttl: float
+    __data: OrderedDict[Hashable, tuple[float, CacheValue]]
+    __lock: threading.Lock
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Args:
+            max_size: entries kept before evicting the least recently used
+            ttl: default time to live of entries, in seconds
+        """
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__data = OrderedDict()
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def get(self, key: Hashable) -> CacheValue | None:
+        with self.__lock:
+            entry = self.__data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.__data[key]
+                self.misses += 1
+                return None
+
+            self.__data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: CacheValue, ttl: float | None = None) -> None:
+        """Stores value, `ttl` may shorten the default time to live."""
+        ttl = self.__ttl if ttl is None else min(ttl, self.__ttl)
+        if ttl <= 0:
+            return
+
+        with self.__lock:
+            self.__data[key] = (time.monotonic() + ttl, value)
+            self.__data.move_to_end(key)
+            while len(self.__data) > self.__max_size:
+                self.__data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self.__lock:
+            self.__data.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__data.clear()
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per process cache, entries are not shared between workers."""
+
+    __cache: LRUTTLCache[dict[str, Any]]
+
+    def __init__(self, max_size: int, ttl: float):
+        self.__cache = LRUTTLCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return self.__cache.get(key)
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        self.__cache.set(key, value)
+
+    async def delete(self, key: str) -> None:
+        self.__cache.delete(key)
+
+    async def clear(self) -> None:
+        self.__cache.clear()
+
+
+class NullCacheBackend(CacheBackend):
+    """Disabled cache, every lookup is a miss."""
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return None
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        pass
+
+    async def delete(self, key: str) -> None:
+        pass
+
+    async def clear(self) -> None:
+        pass
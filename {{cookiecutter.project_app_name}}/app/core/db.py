@@ -3,12 +3,18 @@ SQLAlchemy async engine and sessions tools
 
 https://docs.sqlalchemy.org/en/20/orm/extensions/asyncio.html
 """
+import asyncio
+import logging
+import time
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
-from typing import AsyncIterator, Self
+from typing import Any, AsyncIterator, Self
 
-from sqlalchemy import text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import exc, text
+from sqlalchemy.engine import Engine, Result
+from sqlalchemy.sql import Executable, Select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
@@ -18,16 +24,149 @@ from sqlalchemy.ext.asyncio import (
 from sqlmodel import SQLModel
 
 from app import settings, Settings
+from app.core.metrics import DB_POOL_CHECKOUT_SECONDS, DB_POOL_CHECKOUT_TIMEOUTS
 
-if settings.ENVIRONMENT == "PYTEST":
-    sqlalchemy_database_uri = settings.TEST_SQLALCHEMY_DATABASE_URI
-else:
-    sqlalchemy_database_uri = settings.SQLALCHEMY_DATABASE_URI
+logger = logging.getLogger(__name__)
 
 
-async_engine = create_async_engine(url=sqlalchemy_database_uri, pool_pre_ping=True)
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool exporting checkout wait time and timeouts as metrics"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+
+
+def get_database_uri(settings: Settings) -> str:
+    if settings.ENVIRONMENT == "PYTEST":
+        return settings.TEST_SQLALCHEMY_DATABASE_URI
+    return settings.SQLALCHEMY_DATABASE_URI
+
+
+def get_replica_database_uris(settings: Settings) -> list[str]:
+    if settings.ENVIRONMENT == "PYTEST":
+        return settings.TEST_DATABASE_REPLICA_URIS
+    return settings.DATABASE_REPLICA_URIS
+
+
+def create_async_engine_with_config(
+    settings: Settings, url: str | None = None, **kwargs: Any
+) -> AsyncEngine:
+    """Creates engine with the pool sizing and timeouts from settings
+
+    Args:
+        url: database URI, primary database of the environment by default
+    """
+    connect_args: dict[str, Any] = {"command_timeout": settings.DATABASE_COMMAND_TIMEOUT}
+    if settings.DATABASE_STATEMENT_TIMEOUT:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT)
+        }
+
+    return create_async_engine(
+        url=url or get_database_uri(settings),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        connect_args=connect_args,
+        **kwargs,
+    )
+
+
+class ReplicaSet:
+    """Read replica engines, picked by least in-flight sessions"""
+
+    __engines: list[AsyncEngine]
+    __in_flight: dict[Engine, int]
+
+    def __init__(self, engines: list[AsyncEngine]):
+        self.__engines = list(engines)
+        self.__in_flight = {engine.sync_engine: 0 for engine in self.__engines}
+
+    def __bool__(self) -> bool:
+        return bool(self.__engines)
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        return self.__engines
+
+    def in_flight(self, engine: Engine) -> int:
+        return self.__in_flight[engine]
+
+    def acquire(self) -> Engine:
+        engine = min(self.__in_flight, key=self.__in_flight.__getitem__)
+        self.__in_flight[engine] += 1
+        return engine
+
+    def release(self, engine: Engine) -> None:
+        self.__in_flight[engine] -= 1
+
+    async def dispose(self) -> None:
+        for engine in self.__engines:
+            await engine.dispose()
+
+
+class RoutingSession(Session):
+    """Session sending reads to a replica and writes to the primary (its bind).
+
+    The replica is picked on the first read. After any statement that is not a
+    plain SELECT (flush, INSERT/UPDATE/DELETE, SELECT FOR UPDATE, text...) the
+    session sticks to the primary, so it reads its own writes.
+    """
+
+    def __init__(self, replica_set: ReplicaSet | None = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.__replica_set = replica_set
+        self.__replica: Engine | None = None
+        self.__use_primary = not replica_set
+
+    @property
+    def uses_primary(self) -> bool:
+        return self.__use_primary
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self.__use_primary:
+            if (
+                not self._flushing
+                and isinstance(clause, Select)
+                and clause._for_update_arg is None
+            ):
+                if self.__replica is None:
+                    self.__replica = self.__replica_set.acquire()
+                return self.__replica
+            self.__use_primary = True
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def close(self) -> None:
+        super().close()
+        if self.__replica is not None:
+            self.__replica_set.release(self.__replica)
+            self.__replica = None
+
+
+async_engine = create_async_engine_with_config(settings)
+replica_set = ReplicaSet(
+    [
+        create_async_engine_with_config(settings, url=uri)
+        for uri in get_replica_database_uris(settings)
+    ]
+)
+# Reads are spread across replicas (if any), see `RoutingSession`
 async_session = sessionmaker(
-    bind=async_engine, class_=AsyncSession, expire_on_commit=False
+    bind=async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    replica_set=replica_set,
 )
 
 
@@ -36,35 +175,159 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def execute_read(
+    session: AsyncSession,
+    statement: Executable,
+    retries: int = settings.DATABASE_READ_RETRIES,
+) -> Result:
+    """Executes an idempotent read, retried when the pooled connection was dead.
+
+    On disconnect SQLAlchemy invalidates the pool, the retry runs on a fresh
+    connection. The session transaction is rolled back before retrying, so it
+    must not hold pending writes.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return await session.execute(statement)
+        except exc.DBAPIError as e:
+            if not e.connection_invalidated or attempt == retries:
+                raise
+            logger.warning("Database connection lost, retrying read")
+            await session.rollback()
+
+
 class AsyncDatabaseContext:
     __engine: AsyncEngine
+    __replica_set: ReplicaSet
     __session: AsyncSession
+    __read_session: AsyncSession
+    __health_sweeper: asyncio.Task | None
+    __health_lock: asyncio.Lock
+    __health_checked_at: float
+    __health_ok: bool
 
-    def __init__(self, engine: AsyncEngine):
+    def __init__(self, engine: AsyncEngine, replica_set: ReplicaSet | None = None):
+        """
+        Args:
+            engine: primary database engine
+            replica_set: read replicas, used by `read_session`
+        """
         self.__engine = engine
+        self.__replica_set = replica_set or ReplicaSet([])
         self.__session = sessionmaker(
             bind=self.__engine, class_=AsyncSession, expire_on_commit=False
         )
+        self.__read_session = sessionmaker(
+            bind=self.__engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            sync_session_class=RoutingSession,
+            replica_set=self.__replica_set,
+        )
+        self.__health_sweeper = None
+        self.__health_lock = asyncio.Lock()
+        self.__health_checked_at = float("-inf")
+        self.__health_ok = False
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self.__engine
+
+    @property
+    def replica_set(self) -> ReplicaSet:
+        return self.__replica_set
 
     @classmethod
     def with_config(cls, settings: Settings) -> Self:
-        if settings.ENVIRONMENT == "PYTEST":
-            database_uri = settings.TEST_SQLALCHEMY_DATABASE_URI
-        else:
-            database_uri = settings.SQLALCHEMY_DATABASE_URI
+        """Builds a context with its own engine and connection pool.
+
+        The app shares a single context per worker (see `app.state`), use this
+        only for standalone scripts.
+        """
         return cls(
-            engine=create_async_engine(
-                url=database_uri,
-                pool_pre_ping=True,
-                echo=settings.DEBUG,
-            )
+            engine=create_async_engine_with_config(settings, echo=settings.DEBUG),
+            replica_set=ReplicaSet(
+                [
+                    create_async_engine_with_config(settings, url=uri, echo=settings.DEBUG)
+                    for uri in get_replica_database_uris(settings)
+                ]
+            ),
         )
 
     async def check_connection(self) -> None:
         async with self.__engine.connect() as db_conn:
             await db_conn.execute(text("SELECT 1"))
 
+    async def is_connection_ok(self, max_age: float = 0, timeout: float | None = None) -> bool:
+        """Cached `check_connection`, for health probes.
+
+        Args:
+            max_age: seconds a previous result is reused, concurrent callers
+                wait for the running check instead of starting their own
+            timeout: seconds before the database is considered unreachable
+        """
+        async with self.__health_lock:
+            if time.monotonic() - self.__health_checked_at >= max_age:
+                try:
+                    await asyncio.wait_for(self.check_connection(), timeout)
+                    self.__health_ok = True
+                except (OSError, exc.SQLAlchemyError, asyncio.TimeoutError):
+                    logger.warning("Database is not reachable", exc_info=True)
+                    self.__health_ok = False
+                self.__health_checked_at = time.monotonic()
+            return self.__health_ok
+
+    def pool_status(self) -> dict[str, int]:
+        pool = self.__engine.pool
+        return {
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+
+    async def sweep_pool(self) -> None:
+        """Pings idle pooled connections.
+
+        The pool is FIFO, so checking out once per idle connection visits each
+        of them. A dead one invalidates the pool, stale connections are then
+        replaced on checkout instead of failing a request.
+        """
+        for _ in range(self.__engine.pool.checkedin()):
+            try:
+                await self.check_connection()
+            except exc.DBAPIError as e:
+                if not e.connection_invalidated:
+                    raise
+                logger.warning("Dead database connection found, pool invalidated")
+                return
+
+    async def __run_health_sweeper(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sweep_pool()
+            except Exception:
+                logger.exception("Database pool health check failed")
+
+    def start_health_sweeper(self, interval: float) -> None:
+        if interval > 0 and self.__health_sweeper is None:
+            self.__health_sweeper = asyncio.create_task(
+                self.__run_health_sweeper(interval)
+            )
+
+    async def stop_health_sweeper(self) -> None:
+        if self.__health_sweeper is not None:
+            self.__health_sweeper.cancel()
+            try:
+                await self.__health_sweeper
+            except asyncio.CancelledError:
+                pass
+            self.__health_sweeper = None
+
     async def close(self) -> None:
+        await self.stop_health_sweeper()
+        await self.__replica_set.dispose()
         await self.__engine.dispose()
 
     async def create_all(self) -> None:
@@ -93,3 +356,15 @@ class AsyncDatabaseContext:
     async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.__session() as async_session:
             yield async_session
+
+    @asynccontextmanager
+    async def write_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Session on the primary database"""
+        async with self.__session() as async_session:
+            yield async_session
+
+    @asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Session reading from a replica until its first write, see `RoutingSession`"""
+        async with self.__read_session() as async_session:
+            yield async_session
@@ -0,0 +1,74 @@
+"""
+Incremental NDJSON / CSV encoders for streamed exports.
+
+Encoders take batches of rows (mappings, as yielded by `BaseQueryset.stream`)
+and yield one bytes chunk per batch, so only one batch is held in memory.
+Used with `StreamingResponse`, the next batch is fetched from the database
+only once the previous chunk was sent, which gives backpressure for free.
+"""
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic.json import pydantic_encoder
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def ndjson_chunks(
+    batches: AsyncIterator[Sequence[Mapping[str, Any]]]
+) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield "".join(
+            json.dumps(dict(row), default=pydantic_encoder, separators=(",", ":")) + "\n"
+            for row in batch
+        ).encode()
+
+
+async def csv_chunks(
+    columns: Sequence[str], batches: AsyncIterator[Sequence[Mapping[str, Any]]]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> bytes:
+        chunk = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(columns)
+    yield flush()
+    async for batch in batches:
+        writer.writerows(
+            [_csv_value(row[column]) for column in columns] for row in batch
+        )
+        yield flush()
+
+
+def _csv_value(value: Any) -> Any:
+    # Same datetime format as the JSON API
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def export_chunks(
+    export_format: ExportFormat,
+    columns: Sequence[str],
+    batches: AsyncIterator[Sequence[Mapping[str, Any]]],
+) -> AsyncIterator[bytes]:
+    if export_format is ExportFormat.CSV:
+        return csv_chunks(columns, batches)
+    return ndjson_chunks(batches)
@@ -0,0 +1,82 @@
+"""
+In-process application metrics.
+
+Metrics are plain module level objects, updated from anywhere in the app.
+"""
+import bisect
+import threading
+
+
+class Counter:
+    """Monotonically increasing value, safe to increment from worker threads."""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self.__value = 0.0
+        self.__lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        with self.__lock:
+            self.__value += amount
+
+    @property
+    def value(self) -> float:
+        return self.__value
+
+
+class Histogram:
+    """Cumulative buckets of observed values, Prometheus style."""
+
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self.__counts = [0] * (len(self.buckets) + 1)  # last one is +Inf
+        self.__sum = 0.0
+        self.__lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self.__lock:
+            self.__counts[index] += 1
+            self.__sum += value
+
+    @property
+    def sum(self) -> float:
+        return self.__sum
+
+    @property
+    def count(self) -> int:
+        return sum(self.__counts)
+
+    def cumulative_counts(self) -> list[int]:
+        """Observations `<=` each bucket bound, the last item is +Inf"""
+        with self.__lock:
+            counts = list(self.__counts)
+        for i in range(1, len(counts)):
+            counts[i] += counts[i - 1]
+        return counts
+
+
+PASSWORD_HASHER_REJECTED = Counter(
+    "password_hasher_rejected_total",
+    "Password hash/verify calls rejected because the hasher queue was full.",
+)
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled database connection, including new connections.",
+)
+
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Pool checkouts that gave up after DATABASE_POOL_TIMEOUT seconds.",
+)
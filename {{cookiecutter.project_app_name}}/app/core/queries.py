@@ -1,24 +1,221 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Generic, TypeVar
 
 from sqlmodel import SQLModel
+from sqlalchemy import (
+    Column,
+    Table,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql import ColumnElement, Select
+
+from app.core.pagination import DEFAULT_PAGE_SIZE, KeysetPage, decode_cursor, encode_cursor
 
 DatabaseModel = TypeVar("DatabaseModel", bound=SQLModel)
 
+#: PostgreSQL protocol limit of bind parameters per statement
+MAX_BIND_PARAMS = 32767
+
 
 class BaseQueryset(ABC, Generic[DatabaseModel]):
+    """Async repository over a table model.
+
+    Bulk operations are single multi-row statements with `RETURNING`, so N
+    items cost one round trip. Nothing is committed, callers own the
+    transaction.
+    """
+
     #: Database Model class
-    __db_model_class: SQLModel = None
+    __db_model_class: type[DatabaseModel] = None
     #: Database object (select, delete), SqlAlchemy statement (from sqlalchemy.sql.expression)
-    __queryset = None
+    __queryset: Select = None
     #: Database async session
     __async_session: AsyncSession = None
 
     def __init__(self, async_session: AsyncSession):
         self.__db_model_class = self._get_db_model_class()
+        self.__queryset = select(self.__db_model_class)
         self.__async_session = async_session
 
     @abstractmethod
-    def _get_db_model_class(self) -> DatabaseModel:
+    def _get_db_model_class(self) -> type[DatabaseModel]:
         raise NotImplementedError
+
+    @property
+    def db_model_class(self) -> type[DatabaseModel]:
+        return self.__db_model_class
+
+    @property
+    def queryset(self) -> Select:
+        return self.__queryset
+
+    @property
+    def async_session(self) -> AsyncSession:
+        return self.__async_session
+
+    @property
+    def table(self) -> Table:
+        return self.__db_model_class.__table__
+
+    @property
+    def pk_column(self) -> Column:
+        return self.table.primary_key.columns.values()[0]
+
+    def _pk_in(self, ids: Sequence[Any]) -> ColumnElement:
+        # `= ANY(:ids)` keeps a single bind parameter (and prepared statement)
+        # whatever the number of ids, unlike `IN (...)`
+        pk_column = self.pk_column
+        return pk_column == any_(
+            bindparam(None, list(ids), type_=ARRAY(pk_column.type))
+        )
+
+    def _where(self, statement, criteria: Sequence[ColumnElement], filters: dict[str, Any]):
+        statement = statement.where(*criteria)
+        for name, value in filters.items():
+            statement = statement.where(self.table.c[name] == value)
+        return statement
+
+    def _to_row(self, item: DatabaseModel | dict[str, Any]) -> dict[str, Any]:
+        # Through the model, so every row gets the same keys and Python defaults
+        if isinstance(item, dict):
+            item = self.__db_model_class(**item)
+        return item.dict()
+
+    async def _execute_returning_models(self, statement) -> list[DatabaseModel]:
+        result = await self.__async_session.execute(
+            select(self.__db_model_class)
+            .from_statement(statement.returning(*self.table.c))
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def get(self, pk: Any) -> DatabaseModel | None:
+        return await self.__async_session.get(self.__db_model_class, pk)
+
+    async def get_many(self, ids: Sequence[Any]) -> list[DatabaseModel]:
+        """Objects with the given primary keys in one query, missing ones are skipped"""
+        if not ids:
+            return []
+        result = await self.__async_session.execute(self.queryset.where(self._pk_in(ids)))
+        return list(result.scalars().all())
+
+    async def filter(self, *criteria: ColumnElement, **filters: Any) -> list[DatabaseModel]:
+        """Objects matching SQL expressions and/or `column=value` filters"""
+        result = await self.__async_session.execute(
+            self._where(self.queryset, criteria, filters)
+        )
+        return list(result.scalars().all())
+
+    async def count(self, *criteria: ColumnElement, **filters: Any) -> int:
+        statement = select(func.count()).select_from(self.table)
+        result = await self.__async_session.execute(
+            self._where(statement, criteria, filters)
+        )
+        return result.scalar_one()
+
+    async def stream(
+        self, *criteria: ColumnElement, batch_size: int = 1000, **filters: Any
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Rows as column mappings, in batches read from a server side cursor
+
+        Plain rows rather than models, so nothing accumulates in the identity
+        map and memory is bounded by `batch_size` whatever the table size.
+        """
+        statement = self._where(select(*self.table.c), criteria, filters)
+        result = await self.__async_session.stream(
+            statement.execution_options(yield_per=batch_size)
+        )
+        async for partition in result.mappings().partitions():
+            yield partition
+
+    async def paginate(
+        self,
+        *criteria: ColumnElement,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        **filters: Any,
+    ) -> KeysetPage:
+        """Page of objects ordered by `(created_at, uuid)`, see `app.core.pagination`
+
+        One extra row is fetched to know whether a next page exists.
+
+        Args:
+            cursor: `next_cursor` of the previous page, None for the first page
+            limit: page size
+
+        Raises:
+            InvalidCursorError: malformed cursor
+        """
+        created_at, pk_column = self.table.c.created_at, self.pk_column
+        statement = self._where(self.queryset, criteria, filters)
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(created_at, pk_column) > tuple_(*decode_cursor(cursor))
+            )
+        result = await self.__async_session.execute(
+            statement.order_by(created_at, pk_column).limit(limit + 1)
+        )
+        items = list(result.scalars().all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(
+                items[-1].created_at, getattr(items[-1], pk_column.key)
+            )
+        return KeysetPage(items=items, next_cursor=next_cursor)
+
+    async def bulk_create(
+        self, items: Sequence[DatabaseModel | dict[str, Any]]
+    ) -> list[DatabaseModel]:
+        """Inserts items with a single `INSERT ... VALUES (...), (...) RETURNING`
+
+        Split in several statements only above the bind parameters limit.
+        """
+        rows = [self._to_row(item) for item in items]
+        batch_size = MAX_BIND_PARAMS // len(self.table.c)
+        created = []
+        for i in range(0, len(rows), batch_size):
+            created += await self._execute_returning_models(
+                insert(self.table).values(rows[i : i + batch_size])
+            )
+        return created
+
+    async def bulk_update(
+        self, ids: Sequence[Any], values: dict[str, Any]
+    ) -> list[DatabaseModel]:
+        """Sets the same values on all given objects, returns the updated ones"""
+        if not ids:
+            return []
+        return await self._execute_returning_models(
+            update(self.table).where(self._pk_in(ids)).values(**values)
+        )
+
+    async def bulk_delete(self, ids: Sequence[Any]) -> list[Any]:
+        """Deletes the given objects, returns the primary keys actually deleted"""
+        if not ids:
+            return []
+        result = await self.__async_session.execute(
+            delete(self.table).where(self._pk_in(ids)).returning(self.pk_column)
+        )
+        deleted = list(result.scalars().all())
+
+        # Deleted objects loaded in this session must not be flushed again
+        identity_map = self.__async_session.sync_session.identity_map
+        for pk in deleted:
+            instance = identity_map.get(identity_key(self.__db_model_class, pk))
+            if instance is not None:
+                self.__async_session.expunge(instance)
+        return deleted
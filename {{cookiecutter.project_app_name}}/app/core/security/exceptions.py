@@ -16,3 +16,7 @@ class AuthUserNotFoundError(Exception):
 
 class AuthPasswordError(Exception):
     pass
+
+
+class PasswordHasherBusyError(Exception):
+    pass
@@ -0,0 +1,103 @@
+"""
+Password hashing off the event loop.
+
+bcrypt is CPU bound (about 0.3s per call for 12 rounds), calling it from a
+coroutine blocks every request served by the worker. `PasswordHasher` runs it
+in a thread or process pool and bounds the amount of pending work: when the
+queue is full new calls fail fast with `PasswordHasherBusyError`.
+"""
+import asyncio
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Literal
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.core.metrics import PASSWORD_HASHER_REJECTED
+from app.core.security.exceptions import PasswordHasherBusyError
+
+PWD_CONTEXT = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.SECURITY_BCRYPT_ROUNDS,
+)
+
+
+# Module level functions, so they can be pickled for the process pool
+def hash_password(password: str) -> str:
+    return PWD_CONTEXT.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return PWD_CONTEXT.verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    __kind: Literal["thread", "process"]
+    __max_workers: int
+    __executor: Executor | None
+    __slots: threading.BoundedSemaphore
+
+    def __init__(
+        self,
+        kind: Literal["thread", "process"],
+        max_workers: int,
+        max_queue_size: int,
+    ):
+        """
+        Args:
+            kind: "thread" (bcrypt releases the GIL) or "process"
+            max_workers: pool size
+            max_queue_size: calls allowed to wait for a free worker
+        """
+        self.__kind = kind
+        self.__max_workers = max_workers
+        self.__executor = None
+        self.__slots = threading.BoundedSemaphore(max_workers + max_queue_size)
+
+    @property
+    def executor(self) -> Executor:
+        # Created on first use, a process pool must not be spawned at import
+        if self.__executor is None:
+            if self.__kind == "process":
+                self.__executor = ProcessPoolExecutor(max_workers=self.__max_workers)
+            else:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.__max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self.__executor
+
+    async def __submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if not self.__slots.acquire(blocking=False):
+            PASSWORD_HASHER_REJECTED.inc()
+            raise PasswordHasherBusyError("Password hasher queue is full")
+
+        try:
+            future: Future = self.executor.submit(fn, *args)
+        except BaseException:
+            self.__slots.release()
+            raise
+        # Slot is released when the work is really done, even if the caller
+        # was cancelled in the meantime
+        future.add_done_callback(lambda _: self.__slots.release())
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        return await self.__submit(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.__submit(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+            self.__executor = None
+
+
+password_hasher = PasswordHasher(
+    kind=settings.SECURITY_PASSWORD_HASHER_POOL,
+    max_workers=settings.SECURITY_PASSWORD_HASHER_WORKERS,
+    max_queue_size=settings.SECURITY_PASSWORD_HASHER_QUEUE_SIZE,
+)
@@ -18,9 +18,16 @@ class AccessTokenResponse(BaseModel):
 class JWTSubject(BaseModel):
     user_uuid: str
 
+    class Config:
+        allow_mutation = False
+
 
 class JWTTokenPayload(BaseModel):
     sub: JWTSubject
     refresh: bool
     issued_at: int
     expires_at: int
+
+    class Config:
+        # Decoded payloads are cached and shared between requests
+        allow_mutation = False
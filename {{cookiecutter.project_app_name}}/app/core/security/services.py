@@ -1,7 +1,10 @@
+import hashlib
+import hmac
+import json
 import time
 import jwt
+from jwt.utils import base64url_encode
 from typing import Tuple
-from passlib.context import CryptContext
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
@@ -10,22 +13,31 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import settings
+from app.api.cache import user_cache
 from app.api.models import UserModel
-from app.core.db import get_async_session
+from app.core.cache import LRUTTLCache
+from app.core.db import execute_read, get_async_session
 from app.core.security.exceptions import AuthPasswordError, AuthUserNotFoundError, JWTDecodeError, JWTTokenInvalidError, JWTTokenExpiredError
-from app.core.security.schemas import AccessTokenResponse, JWTSubject, JWTTokenPayload
+from app.core.security.hashing import PWD_CONTEXT, password_hasher
+from app.core.security.schemas import AccessTokenResponse, JWTTokenPayload
 
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_SECS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 REFRESH_TOKEN_EXPIRE_SECS = settings.REFRESH_TOKEN_EXPIRE_MINUTES * 60
-PWD_CONTEXT = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=settings.SECURITY_BCRYPT_ROUNDS,
+# Same header and key PyJWT builds on every `jwt.encode` call for HS256
+JWT_HEADER_SEGMENT = base64url_encode(
+    json.dumps({"alg": JWT_ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode()
 )
+JWT_SIGNING_KEY = settings.SECRET_KEY.encode()
 
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl="auth/access-token")
 
+#: Validated payloads by token digest, `hits` and `misses` are its counters
+DECODED_TOKEN_CACHE: LRUTTLCache[JWTTokenPayload] = LRUTTLCache(
+    max_size=settings.JWT_DECODE_CACHE_MAX_SIZE,
+    ttl=settings.JWT_DECODE_CACHE_TTL_SECONDS,
+)
+
 
 
 class JWTService:
@@ -49,6 +61,25 @@ class JWTService:
                 "Could not validate credentials, token expired or not yet valid"
             )
 
+    @staticmethod
+    def __encode_jwt_token(
+        subject: str, issued_at: int, expires_at: int, refresh: bool
+    ) -> str:
+        """HS256 encoding, output is identical to `jwt.encode` of `JWTTokenPayload.dict()`"""
+        payload = {
+            "sub": {"user_uuid": subject},
+            "refresh": refresh,
+            "issued_at": issued_at,
+            "expires_at": expires_at,
+        }
+        signing_input = (
+            JWT_HEADER_SEGMENT
+            + b"."
+            + base64url_encode(json.dumps(payload, separators=(",", ":")).encode())
+        )
+        signature = hmac.new(JWT_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+        return (signing_input + b"." + base64url_encode(signature)).decode()
+
     @classmethod
     def create_jwt_token(
         cls, subject: str | int, exp_secs: int, refresh: bool
@@ -63,37 +94,30 @@ class JWTService:
 
         issued_at = int(time.time())
         expires_at = issued_at + exp_secs
-
-        to_encode: dict[str, int | str | bool] = JWTTokenPayload(
-            sub=JWTSubject(user_uuid=subject),
-            refresh=refresh,
-            issued_at=issued_at,
-            expires_at=expires_at,
-        ).dict()
-        encoded_jwt = jwt.encode(
-            to_encode,
-            key=settings.SECRET_KEY,
-            algorithm=JWT_ALGORITHM,
-        )
+        encoded_jwt = cls.__encode_jwt_token(str(subject), issued_at, expires_at, refresh)
         return encoded_jwt, expires_at, issued_at
 
     @classmethod
     def generate_access_token_response(cls, subject: str | int) -> AccessTokenResponse:
-        """Generate tokens and return AccessTokenResponse"""
-        access_token, expires_at, issued_at = cls.create_jwt_token(
-            subject, ACCESS_TOKEN_EXPIRE_SECS, refresh=False
-        )
-        refresh_token, refresh_expires_at, refresh_issued_at = cls.create_jwt_token(
-            subject, REFRESH_TOKEN_EXPIRE_SECS, refresh=True
-        )
-        return AccessTokenResponse(
+        """Generate tokens and return AccessTokenResponse
+
+        Both tokens share a single clock read, the response is built without
+        validation since all its fields are produced here.
+        """
+        subject = str(subject)
+        issued_at = int(time.time())
+        expires_at = issued_at + ACCESS_TOKEN_EXPIRE_SECS
+        refresh_expires_at = issued_at + REFRESH_TOKEN_EXPIRE_SECS
+        return AccessTokenResponse.construct(
             token_type="Bearer",
-            access_token=access_token,
+            access_token=cls.__encode_jwt_token(subject, issued_at, expires_at, False),
             expires_at=expires_at,
             issued_at=issued_at,
-            refresh_token=refresh_token,
+            refresh_token=cls.__encode_jwt_token(
+                subject, issued_at, refresh_expires_at, True
+            ),
             refresh_token_expires_at=refresh_expires_at,
-            refresh_token_issued_at=refresh_issued_at,
+            refresh_token_issued_at=issued_at,
         )
 
     @staticmethod
@@ -114,15 +138,47 @@ class JWTService:
         """
         return PWD_CONTEXT.hash(password)
 
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Same as `verify_password`, executed in the password hasher pool.
+
+        Raises `PasswordHasherBusyError` if the pool queue is full.
+        """
+        return await password_hasher.verify(plain_password, hashed_password)
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """Same as `get_password_hash`, executed in the password hasher pool.
+
+        Raises `PasswordHasherBusyError` if the pool queue is full.
+        """
+        return await password_hasher.hash(password)
+
     @classmethod
     def decode_token(cls, token: str, refresh: bool = False) -> JWTTokenPayload:
-        payload = cls.__decode_jwt_token(token=token)
-        token_data: JWTTokenPayload = JWTTokenPayload(**payload)
+        """Decodes and validates token.
+
+        Validated payloads are cached by token digest until the token expires,
+        so reused tokens skip signature verification and payload parsing.
+        The refresh flag and time window are still checked on every call.
+        """
+        token_digest = hashlib.sha256(token.encode()).digest()
+        token_data: JWTTokenPayload | None = DECODED_TOKEN_CACHE.get(token_digest)
+        cached = token_data is not None
+
+        if not cached:
+            payload = cls.__decode_jwt_token(token=token)
+            token_data = JWTTokenPayload(**payload)
 
         if refresh and not token_data.refresh:
             raise JWTTokenInvalidError("Could not validate credentials, cannot use access token")
 
         cls.__is_token_time_valid(token_data=token_data)
+
+        if not cached:
+            DECODED_TOKEN_CACHE.set(
+                token_digest, token_data, ttl=token_data.expires_at - time.time()
+            )
         return token_data
 
 
@@ -131,19 +187,23 @@ class AuthenticationService:
     __user: UserModel = None
     __token_data: JWTTokenPayload
 
-    # TODO cache?
     async def get_current_user(self) -> UserModel:
         if not self.__user:
-            result = await self.__db_async_session.execute(
-                select(UserModel).where(UserModel.uuid == self.__token_data.sub.user_uuid)
-            )
-            user: UserModel = result.scalars().first()
+            user = await user_cache.get(self.user_uuid, self.__db_async_session)
 
             if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="User not found.",
+                result = await execute_read(
+                    self.__db_async_session,
+                    select(UserModel).where(UserModel.uuid == self.user_uuid),
                 )
+                user = result.scalars().first()
+
+                if not user:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="User not found.",
+                    )
+                await user_cache.set(user)
             self.__user = user
         return self.__user
 
@@ -168,13 +228,16 @@ class AuthenticationService:
     ) -> AccessTokenResponse:
         """OAuth2 compatible token, get an access token for future requests using username and password"""
 
-        result = await db_async_session.execute(select(UserModel).where(UserModel.nickname == form_data.username))
+        result = await execute_read(
+            db_async_session,
+            select(UserModel).where(UserModel.nickname == form_data.username),
+        )
         user: UserModel = result.scalars().first()
 
         if user is None:
             raise AuthUserNotFoundError("Incorrect nickname or password")
 
-        if not JWTService.verify_password(form_data.password, user.hashed_password):
+        if not await JWTService.verify_password_async(form_data.password, user.hashed_password):
             raise AuthPasswordError("Incorrect password format")
 
         return JWTService.generate_access_token_response(str(user.uuid))
@@ -187,8 +250,9 @@ class AuthenticationService:
     ) -> AccessTokenResponse:
         token_data: JWTTokenPayload = JWTService.decode_token(token=input_token, refresh=True)
 
-        result = await db_async_session.execute(
-            select(UserModel).where(UserModel.uuid == token_data.sub.user_uuid)
+        result = await execute_read(
+            db_async_session,
+            select(UserModel).where(UserModel.uuid == token_data.sub.user_uuid),
         )
         user: UserModel = result.scalars().first()
 
@@ -1,8 +1,8 @@
 from abc import ABC
 
-from fastapi import Query, Request, FastAPI
+from fastapi import Depends, Query, Request, FastAPI
 
-from app.core.config import Settings, settings
+from app.core.config import Settings
 from app.core.db import AsyncDatabaseContext
 
 
@@ -31,11 +31,19 @@ class BaseAppService(ABC):
         return self.app.state.settings
 
 
+def get_async_db_context(request: Request) -> AsyncDatabaseContext:
+    """Process wide database context, created by `startup_event_manager`"""
+    return request.app.state.async_db_context
+
+
 class BaseDatabaseService(ABC):
     __async_db_context: AsyncDatabaseContext
 
-    def __init__(self):
-        self.__async_db_context = AsyncDatabaseContext.with_config(settings=settings)
+    def __init__(
+        self,
+        async_db_context: AsyncDatabaseContext = Depends(get_async_db_context),
+    ):
+        self.__async_db_context = async_db_context
 
     @property
     def async_db_context(self) -> AsyncDatabaseContext:
@@ -1,18 +1,19 @@
 """Main FastAPI app instance declaration."""
 import uvicorn
-import click
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import JSONResponse
 from fastapi_pagination import add_pagination
-from sqlalchemy import text
 
 from app import settings
-from app.core.db import AsyncDatabaseContext, async_engine
+from app.core.db import AsyncDatabaseContext, async_engine, replica_set
 from app.api.api import api_router
 from app.core.config import settings
-from app.schemas.common import HealthCheck
+from app.core.security.exceptions import PasswordHasherBusyError
+from app.core.security.hashing import password_hasher
+from app.schemas.common import HealthCheck, LivenessCheck
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -40,33 +41,60 @@ app.add_middleware(
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.ALLOWED_HOSTS)
 
 
-# HealthCheck
-@app.get("/", response_model=HealthCheck, tags=["status"])
-async def health_check():
-    database_ok = True
-    try:
-        click.secho("Connecting to database...")
-        async with async_engine.connect() as db_connection:
-            await db_connection.execute(text("SELECT 1"))
-        async_engine.dispose()
-        click.secho("Database is ready and reachable!", fg="green")
-    except OSError:
-        click.secho("Failed connection!", fg="red")
-        database_ok = False
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusyError):
+    # Shed load fast instead of queueing logins behind a saturated bcrypt pool
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service busy, try again later."},
+        headers={"Retry-After": "1"},
+    )
+
 
+# HealthCheck
+async def _health_check(request: Request) -> HealthCheck:
+    async_db_context: AsyncDatabaseContext = request.app.state.async_db_context
+    database_ok = await async_db_context.is_connection_ok(
+        max_age=settings.HEALTH_CHECK_CACHE_SECONDS,
+        timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+    )
     return HealthCheck.parse_obj(
         {
             "name": settings.PROJECT_NAME,
             "version": settings.VERSION,
             "description": settings.DESCRIPTION,
             "db_connection": "OK" if database_ok else "KO",
+            "pool": async_db_context.pool_status(),
         }
     )
 
+
+@app.get("/", response_model=HealthCheck, tags=["status"])
+async def health_check(request: Request):
+    return await _health_check(request)
+
+
+@app.get("/health/live", response_model=LivenessCheck, tags=["status"])
+async def liveness_check():
+    """The process is up and serving requests, no dependency is checked"""
+    return LivenessCheck(status="OK")
+
+
+@app.get("/health/ready", response_model=HealthCheck, tags=["status"])
+async def readiness_check(request: Request, response: Response):
+    """Database reachable, results are cached for HEALTH_CHECK_CACHE_SECONDS"""
+    health = await _health_check(request)
+    if health.db_connection != "OK":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return health
+
+
 @app.on_event("startup")
 async def startup_event_manager():
-    async_db_context = AsyncDatabaseContext.with_config(settings=settings)
+    # Shares the module engine, so there is a single connection pool per worker
+    async_db_context = AsyncDatabaseContext(engine=async_engine, replica_set=replica_set)
     await async_db_context.check_connection()
+    async_db_context.start_health_sweeper(settings.DATABASE_POOL_HEALTH_CHECK_INTERVAL)
     app.state.async_db_context = async_db_context
 
     # TODO Añadir un admin_backoffice
@@ -75,6 +103,7 @@ async def startup_event_manager():
 @app.on_event("shutdown")
 async def shutdown_event_manager():
     app.state.async_db_context.close()
+    password_hasher.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_async_session
+from app.core.security.exceptions import (
+    AuthPasswordError,
+    AuthUserNotFoundError,
+    JWTDecodeError,
+    JWTTokenExpiredError,
+    JWTTokenInvalidError,
+)
+from app.core.security.schemas import AccessTokenResponse, RefreshTokenRequest
+from app.core.security.services import AuthenticationService
+
+router = APIRouter()
+
+
+@router.post("/access-token", response_model=AccessTokenResponse)
+async def login_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db_async_session: AsyncSession = Depends(get_async_session),
+):
+    """OAuth2 compatible token, get an access token for future requests using username and password"""
+    try:
+        return await AuthenticationService.login_access_token(form_data, db_async_session)
+    except (AuthUserNotFoundError, AuthPasswordError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Incorrect email or password",
+        )
+
+
+@router.post("/refresh-token", response_model=AccessTokenResponse)
+async def refresh_token(
+    input: RefreshTokenRequest,
+    db_async_session: AsyncSession = Depends(get_async_session),
+):
+    """OAuth2 compatible token, get an access token for future requests using refresh token"""
+    try:
+        return await AuthenticationService.refresh_access_token(
+            input.refresh_token, db_async_session
+        )
+    except (JWTDecodeError, JWTTokenInvalidError, JWTTokenExpiredError) as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except AuthUserNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found.",
+        )
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.crud import HeroQueryset
+from app.core.db import get_async_session
+from app.core.exceptions import InvalidCursorError
+from app.core.export import EXPORT_MEDIA_TYPES, ExportFormat, export_chunks
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, KeysetPage
+from app.core.security.services import AuthenticationService
+from app.schemas.responses import HeroResponse
+
+router = APIRouter()
+
+
+@router.get("", response_model=KeysetPage[HeroResponse])
+async def list_heroes(
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    auth_service: AuthenticationService = Depends(),
+    db_async_session: AsyncSession = Depends(get_async_session),
+):
+    """List heroes, oldest first. Pass `next_cursor` back as `cursor` for the next page"""
+    await auth_service.get_current_user()
+    try:
+        return await HeroQueryset(db_async_session).paginate(cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_heroes(
+    format: ExportFormat = ExportFormat.NDJSON,
+    auth_service: AuthenticationService = Depends(),
+    db_async_session: AsyncSession = Depends(get_async_session),
+):
+    """Stream all heroes as NDJSON or CSV, rows are read from a server side cursor"""
+    await auth_service.get_current_user()
+    queryset = HeroQueryset(db_async_session)
+    return StreamingResponse(
+        export_chunks(format, queryset.table.c.keys(), queryset.stream()),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="heroes.{format.value}"'},
+    )
@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.crud import UserQueryset
+from app.api.services import UserService
+from app.core.db import get_async_session
+from app.core.exceptions import InvalidCursorError
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, KeysetPage
+from app.core.security.services import AuthenticationService
+from app.schemas.requests import UserCreateRequest, UserUpdatePasswordRequest
+from app.schemas.responses import UserResponse
+
+router = APIRouter()
+
+
+@router.get("", response_model=KeysetPage[UserResponse])
+async def list_users(
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    auth_service: AuthenticationService = Depends(),
+    db_async_session: AsyncSession = Depends(get_async_session),
+):
+    """List users, oldest first. Pass `next_cursor` back as `cursor` for the next page"""
+    await auth_service.get_current_user()
+    try:
+        return await UserQueryset(db_async_session).paginate(cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/me", response_model=UserResponse)
+async def read_current_user(
+    auth_service: AuthenticationService = Depends(),
+):
+    """Get current user"""
+    return await auth_service.get_current_user()
+
+
+@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_current_user(
+    auth_service: AuthenticationService = Depends(),
+    user_service: UserService = Depends(),
+):
+    """Delete current user"""
+    await user_service.delete_user(await auth_service.get_current_user())
+
+
+@router.post("/reset-password", response_model=UserResponse)
+async def reset_current_user_password(
+    user_update_password: UserUpdatePasswordRequest,
+    auth_service: AuthenticationService = Depends(),
+    user_service: UserService = Depends(),
+):
+    """Update current user password"""
+    return await user_service.update_password(
+        await auth_service.get_current_user(), user_update_password
+    )
+
+
+@router.post("/register", response_model=UserResponse)
+async def register_new_user(
+    new_user: UserCreateRequest,
+    user_service: UserService = Depends(),
+):
+    """Create new user"""
+    return await user_service.create_user(new_user)
@@ -1,8 +1,20 @@
 from pydantic import BaseModel
 
 
+class PoolStatus(BaseModel):
+   size: int
+   in_use: int
+   idle: int
+   overflow: int
+
+
+class LivenessCheck(BaseModel):
+   status: str
+
+
 class HealthCheck(BaseModel):
    name: str
    version: str
    description: str
    db_connection: str
+   pool: PoolStatus
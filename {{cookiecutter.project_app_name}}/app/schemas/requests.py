@@ -1,10 +1,9 @@
 from typing import Optional
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, EmailStr
 from sqlmodel import Field
 
 from app.api.models import HeroBase, UserBase
 from app.core.models import UUIDModel
-from app.core.security.services import JWTService
 
 
 class BaseRequest(BaseModel):
@@ -13,12 +12,9 @@ class BaseRequest(BaseModel):
 
 
 class UserUpdatePasswordRequest(BaseRequest):
+    # Plain password, hashed by `UserService` in the password hasher pool
     password: str
 
-    @validator("password")
-    def set_password(cls, value):
-        return JWTService.get_password_hash(value)
-
 
 class UserCreateRequest(UserBase, UserUpdatePasswordRequest):
     email: EmailStr
@@ -8,14 +8,16 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import settings
-from app.core.security import JWTService
+from app.core.security.services import JWTService
 from app.core.db import async_engine, async_session
 from app.main import app
 from sqlmodel import SQLModel as Base
+from app.api.cache import user_cache
 from app.api.models import UserModel
 
 default_user_id = "b75365d9-7bf9-4f54-add5-aeab333a087b"
 default_user_email = "geralt@wiedzmin.pl"
+default_user_nickname = "geralt"
 default_user_password = "geralt"
 default_user_password_hash = JWTService.get_password_hash(default_user_password)
 default_user_access_token = JWTService.create_jwt_token(
@@ -53,11 +55,20 @@ async def session(test_db_setup_sessionmaker) -> AsyncGenerator[AsyncSession, No
         await session.commit()
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def clear_user_cache() -> AsyncGenerator[None, None]:
+    yield
+    await user_cache.backend.clear()
+
+
 @pytest_asyncio.fixture(scope="session")
 async def client() -> AsyncGenerator[AsyncClient, None]:
+    # AsyncClient does not send lifespan events
+    await app.router.startup()
     async with AsyncClient(app=app, base_url="http://test") as client:
         client.headers.update({"Host": "localhost"})
         yield client
+    await app.router.shutdown()
 
 
 @pytest_asyncio.fixture
@@ -69,10 +80,11 @@ async def default_user(test_db_setup_sessionmaker) -> UserModel:
         user = result.scalars().first()
         if user is None:
             new_user = UserModel(
+                uuid=default_user_id,
                 email=default_user_email,
+                nickname=default_user_nickname,
                 hashed_password=default_user_password_hash,
             )
-            new_user.id = default_user_id
             session.add(new_user)
             await session.commit()
             await session.refresh(new_user)
@@ -1,15 +1,26 @@
+import time
+
+import jwt
+import pytest
 from httpx import AsyncClient
 
+from app import settings
 from app.main import app
 from app.api.models import UserModel
-from app.tests.conftest import default_user_email, default_user_password
+from app.core.security.exceptions import JWTTokenExpiredError, PasswordHasherBusyError
+from app.core.security.services import DECODED_TOKEN_CACHE, JWTService
+from app.tests.conftest import (
+    default_user_id,
+    default_user_nickname,
+    default_user_password,
+)
 
 
 async def test_auth_access_token(client: AsyncClient, default_user: UserModel):
     response = await client.post(
         app.url_path_for("login_access_token"),
         data={
-            "username": default_user_email,
+            "username": default_user_nickname,
             "password": default_user_password,
         },
         headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -43,7 +54,7 @@ async def test_auth_refresh_token(client: AsyncClient, default_user: UserModel):
     response = await client.post(
         app.url_path_for("login_access_token"),
         data={
-            "username": default_user_email,
+            "username": default_user_nickname,
             "password": default_user_password,
         },
         headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -62,3 +73,60 @@ async def test_auth_refresh_token(client: AsyncClient, default_user: UserModel):
     assert "refresh_token" in token
     assert "refresh_token_expires_at" in token
     assert "refresh_token_issued_at" in token
+
+
+async def test_auth_access_token_hasher_busy(
+    client: AsyncClient, default_user: UserModel, monkeypatch
+):
+    async def busy(*args, **kwargs):
+        raise PasswordHasherBusyError("Password hasher queue is full")
+
+    monkeypatch.setattr(JWTService, "verify_password_async", busy)
+    response = await client.post(
+        app.url_path_for("login_access_token"),
+        data={
+            "username": default_user_nickname,
+            "password": default_user_password,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+async def test_decode_token_is_cached():
+    token, _, _ = JWTService.create_jwt_token(default_user_id, 60, refresh=False)
+    hits = DECODED_TOKEN_CACHE.hits
+
+    first = JWTService.decode_token(token)
+    second = JWTService.decode_token(token)
+
+    assert first == second
+    assert DECODED_TOKEN_CACHE.hits == hits + 1
+
+
+async def test_decode_token_cache_respects_expiration(monkeypatch):
+    token, expires_at, _ = JWTService.create_jwt_token(default_user_id, 60, refresh=False)
+    JWTService.decode_token(token)
+
+    monkeypatch.setattr(time, "time", lambda: expires_at + 1)
+    with pytest.raises(JWTTokenExpiredError):
+        JWTService.decode_token(token)
+
+
+async def test_create_jwt_token_matches_pyjwt():
+    token, expires_at, issued_at = JWTService.create_jwt_token(
+        default_user_id, 60, refresh=True
+    )
+
+    assert token == jwt.encode(
+        {
+            "sub": {"user_uuid": default_user_id},
+            "refresh": True,
+            "issued_at": issued_at,
+            "expires_at": expires_at,
+        },
+        key=settings.SECRET_KEY,
+        algorithm="HS256",
+    )
@@ -0,0 +1,197 @@
+import gc
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app import settings
+from app.api.models import UserModel
+from app.core.db import (
+    AsyncDatabaseContext,
+    ReplicaSet,
+    async_engine,
+    create_async_engine_with_config,
+    execute_read,
+)
+from app.core.metrics import DB_POOL_CHECKOUT_SECONDS
+from app.main import app
+
+
+async def test_single_engine_per_worker(client: AsyncClient):
+    gc.collect()
+    engines = [obj for obj in gc.get_objects() if isinstance(obj, AsyncEngine)]
+
+    assert engines == [async_engine]
+    assert app.state.async_db_context.engine is async_engine
+
+
+async def test_pool_checkout_is_measured(client: AsyncClient):
+    count = DB_POOL_CHECKOUT_SECONDS.count
+
+    await app.state.async_db_context.check_connection()
+
+    assert DB_POOL_CHECKOUT_SECONDS.count == count + 1
+
+
+async def test_pool_uses_settings():
+    pool = async_engine.pool
+
+    assert pool.size() == settings.DATABASE_POOL_SIZE
+    assert pool._max_overflow == settings.DATABASE_MAX_OVERFLOW
+    assert pool._timeout == settings.DATABASE_POOL_TIMEOUT
+    assert pool._recycle == settings.DATABASE_POOL_RECYCLE
+
+
+@pytest_asyncio.fixture
+async def no_pre_ping_db_context() -> AsyncGenerator[AsyncDatabaseContext, None]:
+    async_db_context = AsyncDatabaseContext(
+        engine=create_async_engine_with_config(
+            settings.copy(update={"DATABASE_POOL_PRE_PING": False, "DATABASE_POOL_SIZE": 1})
+        )
+    )
+    yield async_db_context
+    await async_db_context.close()
+
+
+async def kill_pooled_connection(async_db_context: AsyncDatabaseContext) -> None:
+    async with async_db_context.get_async_session() as session:
+        backend_pid = (await session.execute(text("SELECT pg_backend_pid()"))).scalar()
+
+    async with async_engine.connect() as db_conn:
+        # Waits for the backend to exit, or the client may see it mid-query
+        await db_conn.execute(
+            text("SELECT pg_terminate_backend(:pid, 5000)"), {"pid": backend_pid}
+        )
+
+
+async def test_read_fails_on_killed_connection_without_retry(
+    no_pre_ping_db_context: AsyncDatabaseContext,
+):
+    await kill_pooled_connection(no_pre_ping_db_context)
+
+    async with no_pre_ping_db_context.get_async_session() as session:
+        with pytest.raises(DBAPIError) as e:
+            await execute_read(session, text("SELECT 1"), retries=0)
+    assert e.value.connection_invalidated
+
+
+async def test_read_retries_on_killed_connection(
+    no_pre_ping_db_context: AsyncDatabaseContext,
+):
+    await kill_pooled_connection(no_pre_ping_db_context)
+
+    async with no_pre_ping_db_context.get_async_session() as session:
+        result = await execute_read(session, text("SELECT 1"), retries=1)
+    assert result.scalar() == 1
+
+
+async def test_sweep_pool_replaces_killed_connection(
+    no_pre_ping_db_context: AsyncDatabaseContext,
+):
+    await kill_pooled_connection(no_pre_ping_db_context)
+
+    await no_pre_ping_db_context.sweep_pool()
+
+    async with no_pre_ping_db_context.get_async_session() as session:
+        result = await execute_read(session, text("SELECT 1"), retries=0)
+    assert result.scalar() == 1
+
+
+@pytest_asyncio.fixture(scope="session")
+async def replica_database_uris() -> AsyncGenerator[list[str], None]:
+    """Two databases standing in for replicas, or TEST_DATABASE_REPLICA_URIS"""
+    if settings.TEST_DATABASE_REPLICA_URIS:
+        yield settings.TEST_DATABASE_REPLICA_URIS
+        return
+
+    url = make_url(settings.TEST_SQLALCHEMY_DATABASE_URI)
+    names = [f"{url.database}_replica_{i}" for i in range(2)]
+    async with async_engine.connect() as db_conn:
+        db_conn = await db_conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name in names:
+            await db_conn.execute(text(f'DROP DATABASE IF EXISTS "{name}"'))
+            await db_conn.execute(text(f'CREATE DATABASE "{name}"'))
+
+    yield [str(url.set(database=name)) for name in names]
+
+    async with async_engine.connect() as db_conn:
+        db_conn = await db_conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name in names:
+            await db_conn.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+
+
+@pytest_asyncio.fixture
+async def replicated_db_context(
+    replica_database_uris: list[str],
+) -> AsyncGenerator[AsyncDatabaseContext, None]:
+    async_db_context = AsyncDatabaseContext(
+        engine=create_async_engine_with_config(settings),
+        replica_set=ReplicaSet(
+            [
+                create_async_engine_with_config(settings, url=uri)
+                for uri in replica_database_uris
+            ]
+        ),
+    )
+    yield async_db_context
+    await async_db_context.close()
+
+
+async def test_read_session_reads_from_replica(
+    replicated_db_context: AsyncDatabaseContext,
+):
+    async with replicated_db_context.read_session() as session:
+        database = (await session.execute(select(func.current_database()))).scalar()
+
+    assert database != make_url(settings.TEST_SQLALCHEMY_DATABASE_URI).database
+    assert "_replica_" in database
+
+
+async def test_read_session_sticks_to_primary_after_write(
+    replicated_db_context: AsyncDatabaseContext,
+):
+    primary = make_url(settings.TEST_SQLALCHEMY_DATABASE_URI).database
+
+    async with replicated_db_context.read_session() as session:
+        session.add(
+            UserModel(email="replica@example.com", nickname="replica", hashed_password="x")
+        )
+        await session.flush()
+        database = (await session.execute(select(func.current_database()))).scalar()
+        user = (
+            await session.execute(
+                select(UserModel).where(UserModel.email == "replica@example.com")
+            )
+        ).scalar_one_or_none()
+        await session.rollback()
+
+    assert database == primary
+    assert user is not None
+
+
+async def test_read_sessions_spread_by_least_in_flight(
+    replicated_db_context: AsyncDatabaseContext,
+):
+    replica_set = replicated_db_context.replica_set
+    databases = set()
+
+    async with replicated_db_context.read_session() as first:
+        databases.add((await first.execute(select(func.current_database()))).scalar())
+        async with replicated_db_context.read_session() as second:
+            databases.add((await second.execute(select(func.current_database()))).scalar())
+            assert [replica_set.in_flight(e.sync_engine) for e in replica_set.engines] == [1, 1]
+
+    assert len(databases) == 2
+    assert [replica_set.in_flight(e.sync_engine) for e in replica_set.engines] == [0, 0]
+
+
+async def test_write_session_uses_primary(replicated_db_context: AsyncDatabaseContext):
+    async with replicated_db_context.write_session() as session:
+        database = (await session.execute(select(func.current_database()))).scalar()
+
+    assert database == make_url(settings.TEST_SQLALCHEMY_DATABASE_URI).database
@@ -0,0 +1,42 @@
+from httpx import AsyncClient
+
+from app.main import app
+
+
+async def test_liveness_check(client: AsyncClient):
+    response = await client.get(app.url_path_for("liveness_check"))
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "OK"}
+
+
+async def test_readiness_check(client: AsyncClient):
+    response = await client.get(app.url_path_for("readiness_check"))
+
+    assert response.status_code == 200
+    health = response.json()
+    assert health["db_connection"] == "OK"
+    assert set(health["pool"]) == {"size", "in_use", "idle", "overflow"}
+
+
+async def test_readiness_check_does_not_dispose_pool(client: AsyncClient):
+    await client.get(app.url_path_for("readiness_check"))
+    pool = app.state.async_db_context.engine.pool
+    idle = pool.checkedin()
+
+    await client.get(app.url_path_for("readiness_check"))
+
+    assert pool is app.state.async_db_context.engine.pool
+    assert pool.checkedin() == idle
+
+
+async def test_readiness_check_is_cached(client: AsyncClient, monkeypatch):
+    await client.get(app.url_path_for("readiness_check"))
+
+    async def fail():
+        raise AssertionError("Database probed again")
+
+    monkeypatch.setattr(app.state.async_db_context, "check_connection", fail)
+    response = await client.get(app.url_path_for("readiness_check"))
+
+    assert response.status_code == 200
@@ -0,0 +1,96 @@
+import uuid as uuid_pkg
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import app
+from app.api.crud import HeroQueryset
+from app.core.exceptions import InvalidCursorError
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+async def create_heroes(session: AsyncSession, count: int) -> list[str]:
+    # Pairs of heroes share created_at, order falls back to uuid
+    start = datetime(2023, 1, 1)
+    heroes = await HeroQueryset(session).bulk_create(
+        [
+            {"nickname": f"hero_{i}", "created_at": start + timedelta(seconds=i // 2)}
+            for i in range(count)
+        ]
+    )
+    await session.commit()
+    return [str(hero.uuid) for hero in sorted(heroes, key=lambda h: (h.created_at, h.uuid))]
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2023, 6, 4, 19, 56, 6, 65360)
+    uuid = uuid_pkg.UUID("b75365d9-7bf9-4f54-add5-aeab333a087b")
+
+    assert decode_cursor(encode_cursor(created_at, uuid)) == (created_at, uuid)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WzFd", "bnVsbA"])
+def test_decode_invalid_cursor(cursor: str):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+async def test_paginate_walks_all_rows(session: AsyncSession):
+    expected = await create_heroes(session, 25)
+    queryset = HeroQueryset(session)
+
+    seen, cursor = [], None
+    while True:
+        page = await queryset.paginate(cursor=cursor, limit=10)
+        seen += [str(hero.uuid) for hero in page.items]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+async def test_paginate_exact_last_page_has_no_cursor(session: AsyncSession):
+    await create_heroes(session, 10)
+
+    page = await HeroQueryset(session).paginate(limit=10)
+
+    assert len(page.items) == 10
+    assert page.next_cursor is None
+
+
+async def test_list_heroes(client: AsyncClient, default_user_headers, session: AsyncSession):
+    expected = await create_heroes(session, 5)
+
+    response = await client.get(
+        app.url_path_for("list_heroes"), params={"limit": 3}, headers=default_user_headers
+    )
+    assert response.status_code == 200
+    first = response.json()
+    assert [hero["uuid"] for hero in first["items"]] == expected[:3]
+
+    response = await client.get(
+        app.url_path_for("list_heroes"),
+        params={"limit": 3, "cursor": first["next_cursor"]},
+        headers=default_user_headers,
+    )
+    assert response.status_code == 200
+    second = response.json()
+    assert [hero["uuid"] for hero in second["items"]] == expected[3:]
+    assert second["next_cursor"] is None
+
+
+async def test_list_heroes_invalid_cursor(client: AsyncClient, default_user_headers):
+    response = await client.get(
+        app.url_path_for("list_heroes"), params={"cursor": "nope"}, headers=default_user_headers
+    )
+    assert response.status_code == 400
+
+
+async def test_list_users(client: AsyncClient, default_user_headers):
+    response = await client.get(app.url_path_for("list_users"), headers=default_user_headers)
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is None
+    assert len(response.json()["items"]) == 1
@@ -0,0 +1,95 @@
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.crud import HeroQueryset, UserQueryset
+from app.api.models import HeroModel, UserModel
+from app.core.db import async_engine
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """SQL statements sent to the database during the test"""
+    executed: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def test_bulk_create_is_one_statement(session: AsyncSession, statements: list[str]):
+    heroes = await HeroQueryset(session).bulk_create(
+        [{"nickname": f"hero_{i}", "role": "mage"} for i in range(50)]
+    )
+    await session.commit()
+
+    assert len(heroes) == 50
+    assert all(isinstance(hero, HeroModel) for hero in heroes)
+    assert len([s for s in statements if s.startswith("INSERT")]) == 1
+
+
+async def test_get_many_is_one_statement(session: AsyncSession, statements: list[str]):
+    queryset = HeroQueryset(session)
+    heroes = await queryset.bulk_create([HeroModel(nickname=f"hero_{i}") for i in range(10)])
+    statements.clear()
+
+    found = await queryset.get_many([hero.uuid for hero in heroes[:5]])
+
+    assert {hero.uuid for hero in found} == {hero.uuid for hero in heroes[:5]}
+    assert len(statements) == 1
+
+
+async def test_filter_and_count(session: AsyncSession):
+    queryset = HeroQueryset(session)
+    await queryset.bulk_create(
+        [{"nickname": "merlin", "role": "mage"}, {"nickname": "conan", "role": "warrior"}]
+    )
+
+    mages = await queryset.filter(role="mage")
+
+    assert [hero.nickname for hero in mages] == ["merlin"]
+    assert await queryset.count() == 2
+    assert await queryset.count(HeroModel.nickname.startswith("con")) == 1
+
+
+async def test_bulk_update_is_one_statement(session: AsyncSession, statements: list[str]):
+    queryset = HeroQueryset(session)
+    heroes = await queryset.bulk_create([{"nickname": f"hero_{i}"} for i in range(10)])
+    statements.clear()
+
+    updated = await queryset.bulk_update([hero.uuid for hero in heroes], {"role": "tank"})
+
+    assert len(updated) == 10
+    assert {hero.role for hero in heroes} == {"tank"}
+    assert len(statements) == 1
+
+
+async def test_bulk_delete_is_one_statement(session: AsyncSession, statements: list[str]):
+    queryset = UserQueryset(session)
+    users = await queryset.bulk_create(
+        [
+            UserModel(email=f"user_{i}@example.com", nickname=f"user_{i}", hashed_password="x")
+            for i in range(10)
+        ]
+    )
+    statements.clear()
+
+    deleted = await queryset.bulk_delete([user.uuid for user in users[:4]])
+    await session.commit()
+
+    assert set(deleted) == {user.uuid for user in users[:4]}
+    assert len([s for s in statements if s.startswith("DELETE")]) == 1
+    assert await queryset.count() == 6
+
+
+async def test_bulk_create_above_bind_params_limit(session: AsyncSession):
+    heroes = await HeroQueryset(session).bulk_create(
+        [{"nickname": f"hero_{i}"} for i in range(6000)]
+    )
+
+    assert len(heroes) == 6000
@@ -3,10 +3,13 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
+from app.api.cache import user_cache
 from app.api.models import UserModel
+from app.schemas.requests import UserCreateRequest
 from app.tests.conftest import (
     default_user_email,
     default_user_id,
+    default_user_nickname,
     default_user_password_hash,
 )
 
@@ -17,8 +20,9 @@ async def test_read_current_user(client: AsyncClient, default_user_headers):
     )
     assert response.status_code == 200
     assert response.json() == {
-        "id": default_user_id,
+        "uuid": default_user_id,
         "email": default_user_email,
+        "nickname": default_user_nickname,
     }
 
 
@@ -29,7 +33,7 @@ async def test_delete_current_user(
         app.url_path_for("delete_current_user"), headers=default_user_headers
     )
     assert response.status_code == 204
-    result = await session.execute(select(User).where(User.id == default_user_id))
+    result = await session.execute(select(UserModel).where(UserModel.uuid == default_user_id))
     user = result.scalars().first()
     assert user is None
 
@@ -43,7 +47,7 @@ async def test_reset_current_user_password(
         json={"password": "testxxxxxx"},
     )
     assert response.status_code == 200
-    result = await session.execute(select(User).where(User.id == default_user_id))
+    result = await session.execute(select(UserModel).where(UserModel.uuid == default_user_id))
     user = result.scalars().first()
     assert user is not None
     assert user.hashed_password != default_user_password_hash
@@ -57,10 +61,46 @@ async def test_register_new_user(
         headers=default_user_headers,
         json={
             "email": "qwe@example.com",
+            "nickname": "qwe",
             "password": "asdasdasd",
         },
     )
     assert response.status_code == 200
-    result = await session.execute(select(User).where(User.email == "qwe@example.com"))
+    result = await session.execute(select(UserModel).where(UserModel.email == "qwe@example.com"))
     user = result.scalars().first()
     assert user is not None
+
+
+async def test_user_create_request_does_not_hash_password():
+    # Hashing is done by UserService in the password hasher pool, not on parse
+    request = UserCreateRequest(
+        email="qwe@example.com", nickname="qwe", password="asdasdasd"
+    )
+    assert request.password == "asdasdasd"
+
+
+async def test_read_current_user_is_cached(client: AsyncClient, default_user_headers):
+    response = await client.get(
+        app.url_path_for("read_current_user"), headers=default_user_headers
+    )
+    assert response.status_code == 200
+    assert await user_cache.backend.get(default_user_id) is not None
+
+    response = await client.get(
+        app.url_path_for("read_current_user"), headers=default_user_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["uuid"] == default_user_id
+
+
+async def test_reset_current_user_password_invalidates_cache(
+    client: AsyncClient, default_user_headers
+):
+    await client.get(app.url_path_for("read_current_user"), headers=default_user_headers)
+    response = await client.post(
+        app.url_path_for("reset_current_user_password"),
+        headers=default_user_headers,
+        json={"password": "testxxxxxx"},
+    )
+    assert response.status_code == 200
+    assert await user_cache.backend.get(default_user_id) is None
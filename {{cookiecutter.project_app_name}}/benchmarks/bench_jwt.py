@@ -0,0 +1,89 @@
+"""
+JWTService token minting micro-benchmark.
+
+Compares `JWTService.generate_access_token_response` against the previous
+implementation (two `JWTTokenPayload` models + `jwt.encode` per token) and
+checks both produce the same tokens.
+
+    python -m benchmarks.bench_jwt
+"""
+import time
+import timeit
+from unittest import mock
+
+import jwt
+
+from app.core.config import settings
+from app.core.security.schemas import AccessTokenResponse, JWTSubject, JWTTokenPayload
+from app.core.security.services import (
+    ACCESS_TOKEN_EXPIRE_SECS,
+    JWT_ALGORITHM,
+    REFRESH_TOKEN_EXPIRE_SECS,
+    JWTService,
+)
+
+SUBJECT = "b75365d9-7bf9-4f54-add5-aeab333a087b"
+
+
+def reference_create_jwt_token(subject: str, exp_secs: int, refresh: bool):
+    issued_at = int(time.time())
+    expires_at = issued_at + exp_secs
+    to_encode = JWTTokenPayload(
+        sub=JWTSubject(user_uuid=subject),
+        refresh=refresh,
+        issued_at=issued_at,
+        expires_at=expires_at,
+    ).dict()
+    encoded_jwt = jwt.encode(to_encode, key=settings.SECRET_KEY, algorithm=JWT_ALGORITHM)
+    return encoded_jwt, expires_at, issued_at
+
+
+def reference_generate_access_token_response(subject: str) -> AccessTokenResponse:
+    access_token, expires_at, issued_at = reference_create_jwt_token(
+        subject, ACCESS_TOKEN_EXPIRE_SECS, refresh=False
+    )
+    refresh_token, refresh_expires_at, refresh_issued_at = reference_create_jwt_token(
+        subject, REFRESH_TOKEN_EXPIRE_SECS, refresh=True
+    )
+    return AccessTokenResponse(
+        token_type="Bearer",
+        access_token=access_token,
+        expires_at=expires_at,
+        issued_at=issued_at,
+        refresh_token=refresh_token,
+        refresh_token_expires_at=refresh_expires_at,
+        refresh_token_issued_at=refresh_issued_at,
+    )
+
+
+def check_compatibility() -> None:
+    with mock.patch("time.time", return_value=1_700_000_000.5):
+        expected = reference_generate_access_token_response(SUBJECT)
+        actual = JWTService.generate_access_token_response(SUBJECT)
+    assert actual.dict() == expected.dict(), "Token responses differ"
+
+
+def main(number: int = 20_000) -> None:
+    check_compatibility()
+
+    reference = min(
+        timeit.repeat(
+            lambda: reference_generate_access_token_response(SUBJECT),
+            number=number,
+            repeat=5,
+        )
+    )
+    lean = min(
+        timeit.repeat(
+            lambda: JWTService.generate_access_token_response(SUBJECT),
+            number=number,
+            repeat=5,
+        )
+    )
+    print(f"reference: {reference / number * 1e6:8.2f} us/call")
+    print(f"lean:      {lean / number * 1e6:8.2f} us/call")
+    print(f"speedup:   {reference / lean:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
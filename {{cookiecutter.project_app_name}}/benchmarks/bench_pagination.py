@@ -0,0 +1,119 @@
+"""
+Offset vs keyset pagination over `hrs_heroes`.
+
+Seeds `--rows` heroes (1M by default) and measures one page at increasing
+depths with:
+
+- offset: `ORDER BY created_at, uuid OFFSET :depth LIMIT :size` plus the
+  `COUNT(*)` offset paginators run on every page
+- keyset: `HeroQueryset.paginate` with the cursor of the row before `:depth`
+
+Seeded rows are deleted at the end, still run it against a disposable
+database, e.g. with `ENVIRONMENT=PYTEST`.
+
+    python -m benchmarks.bench_pagination --rows 1000000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import delete, func, select, text
+from sqlmodel import SQLModel
+
+from app.api.crud import HeroQueryset
+from app.api.models import HeroModel
+from app.core.db import async_engine, async_session
+from app.core.pagination import encode_cursor
+
+NICKNAME_PREFIX = "bench_hero_"
+
+
+async def seed(rows: int) -> None:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.execute(
+            text(
+                "INSERT INTO hrs_heroes (uuid, nickname, created_at, updated_at) "
+                "SELECT gen_random_uuid(), :prefix || i, "
+                "timestamp '2023-01-01' + i * interval '1 second', now() "
+                "FROM generate_series(1, :rows) AS i"
+            ),
+            {"prefix": NICKNAME_PREFIX, "rows": rows},
+        )
+        await conn.execute(text("ANALYZE hrs_heroes"))
+
+
+async def cleanup() -> None:
+    async with async_session() as session:
+        await session.execute(
+            delete(HeroModel)
+            .where(HeroModel.nickname.startswith(NICKNAME_PREFIX))
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+
+async def offset_page(depth: int, size: int) -> None:
+    async with async_session() as session:
+        await session.execute(select(func.count()).select_from(HeroModel))
+        result = await session.execute(
+            select(HeroModel)
+            .order_by(HeroModel.created_at, HeroModel.uuid)
+            .offset(depth)
+            .limit(size)
+        )
+        result.scalars().all()
+
+
+async def keyset_page(cursor: str | None, size: int) -> None:
+    async with async_session() as session:
+        await HeroQueryset(session).paginate(cursor=cursor, limit=size)
+
+
+async def cursor_at(depth: int) -> str | None:
+    """Cursor a client holds after reading `depth` rows, not timed"""
+    if depth == 0:
+        return None
+    async with async_session() as session:
+        result = await session.execute(
+            select(HeroModel.created_at, HeroModel.uuid)
+            .order_by(HeroModel.created_at, HeroModel.uuid)
+            .offset(depth - 1)
+            .limit(1)
+        )
+        return encode_cursor(*result.one())
+
+
+async def timed(coroutine_factory, repeat: int) -> float:
+    """Median duration in milliseconds"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await coroutine_factory()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+async def main(rows: int, size: int, repeat: int) -> None:
+    await seed(rows)
+    try:
+        depths = sorted({0, 1_000, 10_000, rows // 10, rows // 2, rows - size} - {rows})
+        print(f"{'depth':>10} {'offset ms':>10} {'keyset ms':>10}")
+        for depth in depths:
+            cursor = await cursor_at(depth)
+            offset_ms = await timed(lambda: offset_page(depth, size), repeat)
+            keyset_ms = await timed(lambda: keyset_page(cursor, size), repeat)
+            print(f"{depth:>10} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+    finally:
+        await cleanup()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.size, args.repeat))